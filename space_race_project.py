@@ -1,16 +1,61 @@
+import argparse
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+parser = argparse.ArgumentParser(description="Space Race data analysis")
+parser.add_argument(
+    "--no-plot",
+    action="store_true",
+    help="save charts as PNG files in 'exports/' instead of opening windows",
+)
+args = parser.parse_args()
+
+# Without windows the non-interactive Agg backend avoids any GUI toolkit setup
+if args.no_plot:
+    plt.switch_backend("Agg")
+
 # Plot style
 sns.set_style("whitegrid")
 plt.rcParams["figure.figsize"] = (12, 6)
 
+
+def reset_figure(fig, figsize, *axes):
+    """Clear the given axes of a reused figure and resize it for the next chart."""
+    for ax in axes:
+        ax.cla()
+        # cla() keeps grid and spine styling from the previous chart
+        ax.tick_params(which="both", grid_alpha=plt.rcParams["grid.alpha"])
+        for spine in ax.spines.values():
+            spine.set_visible(True)
+    fig.set_size_inches(figsize)
+    # Re-attach the figure to pyplot in case its window was closed
+    plt.figure(fig)
+
+
+def show_figure(fig, name):
+    """Display a finished chart, or save it to exports/ when run with --no-plot."""
+    if args.no_plot:
+        fig.savefig(f"exports/fig_{name}.png", dpi=100)
+    else:
+        plt.show()
+
+
 print("=" * 70)
 print("🚀 SPACE RACE DATA ANALYSIS PROJECT 🚀")
 print("Loading data from CSV file...")
 print("=" * 70)
 
+# With --no-plot, charts are saved into exports/ as soon as they are drawn
+if args.no_plot and not os.path.exists("exports"):
+    os.makedirs("exports")
+    print("\n✅ Created 'exports' directory")
+
 # ============================================
 #  STEP 1: LOAD DATA FROM CSV FILE
 # ============================================
@@ -18,8 +63,16 @@ print("=" * 70)
 print("\n📂 Loading mission_launches.csv...")
 
 try:
-    # Load the CSV file
-    df = pd.read_csv("mission_launches.csv")
+    # Load the CSV file (multithreaded pyarrow parser when available)
+    try:
+        df = pd.read_csv("mission_launches.csv", engine="pyarrow")
+        # pyarrow leaves blank/duplicate header cells as-is; take the C engine's
+        # names ("Unnamed: 0.1", ...) from the header row so exports match
+        df.columns = pd.read_csv("mission_launches.csv", nrows=0).columns
+    except (ImportError, ValueError):
+        # pyarrow missing, or a file it rejects (e.g. rows with missing
+        # fields, raised as ParserError/ArrowInvalid) that the C parser reads
+        df = pd.read_csv("mission_launches.csv")
     print(f"Successfully loaded {len(df)} records")
     print(f"\nOriginal columns: {list(df.columns)}")
 except FileNotFoundError:
@@ -52,10 +105,10 @@ column_mapping = {
 df = df.rename(columns=column_mapping)
 
 # Extract country from location (last part after last comma)
-df["country_full"] = df["location_name"].str.split(",").str[-1].str.strip()
+df["country_full"] = df["location_name"].str.rsplit(",", n=1).str[-1].str.strip()
 
 # Create rocket_family from rocket detail (take first part before |)
-df["rocket_family"] = df["rocket"].str.split("|").str[0].str.strip()
+df["rocket_family"] = df["rocket"].str.split("|", n=1).str[0].str.strip()
 
 print(f"\nDataFrame processed with {len(df)} records")
 print(f"Columns after mapping: {list(df.columns)}")
@@ -69,7 +122,26 @@ print("DATA CLEANING")
 print("=" * 70)
 
 # Convert date column to datetime
-df["date"] = pd.to_datetime(df["date"], errors="coerce")
+# Most launches carry a time ("Fri Aug 07, 2020 05:12 UTC"); older ones may
+# only have the day, so each group is parsed with its own explicit format.
+# All times are UTC, so the parsed values are localized to keep them tz-aware
+has_time = df["date"].str.contains(":", na=False)
+df["date"] = pd.concat(
+    [
+        pd.to_datetime(
+            df.loc[has_time, "date"],
+            format="%a %b %d, %Y %H:%M UTC",
+            errors="coerce",
+            cache=True,
+        ),
+        pd.to_datetime(
+            df.loc[~has_time, "date"],
+            format="%a %b %d, %Y",
+            errors="coerce",
+            cache=True,
+        ),
+    ]
+).dt.tz_localize("UTC")
 
 # Remove records with no date
 df = df.dropna(subset=["date"])
@@ -77,13 +149,15 @@ df = df.dropna(subset=["date"])
 # Extract temporal features
 df["year"] = df["date"].dt.year
 df["month"] = df["date"].dt.month
-df["month_name"] = df["date"].dt.month_name()
 df["decade"] = (df["year"] // 10) * 10
-df["day_of_week"] = df["date"].dt.day_name()
 
-# Categorize success
+# Low-cardinality text columns are grouped and counted repeatedly
+for col in ("country_full", "agency", "status", "rocket_family"):
+    df[col] = df[col].astype("category")
+
+# Categorize success (stored as 0/1 so sums and means stay on integer paths)
 success_keywords = ["Success", "Partial Failure"]
-df["success"] = df["status"].isin(success_keywords)
+df["success"] = df["status"].isin(success_keywords).to_numpy(dtype=np.uint8)
 
 # Map country codes to full names for common countries
 country_mapping = {
@@ -96,7 +170,13 @@ country_mapping = {
     "Japan": "Japan",
     "New Zealand": "New Zealand",
 }
-df["country_full"] = df["country_full"].map(country_mapping).fillna(df["country_full"])
+# On a categorical column the lookup runs once per category, not once per row;
+# the result is re-cast in case two codes merged into one name
+df["country_full"] = (
+    df["country_full"]
+    .map(lambda country: country_mapping.get(country, country))
+    .astype("category")
+)
 
 print(
     f"\nCleaned data: {len(df)} records from "
@@ -121,7 +201,8 @@ print(country_missions)
 
 org_missions = df["agency"].value_counts().head(15)
 
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 6))
+# Side-by-side figure, reused for the monthly charts
+fig_pair, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 6))
 
 # Countries
 country_missions.plot(kind="barh", ax=ax1, color="steelblue")
@@ -135,8 +216,8 @@ ax2.set_title("Top 15 Organizations by Space Missions", fontsize=14, fontweight=
 ax2.set_xlabel("Number of Missions", fontsize=11)
 ax2.set_ylabel("Organization", fontsize=11)
 
-plt.tight_layout()
-plt.show()
+fig_pair.tight_layout()
+show_figure(fig_pair, "missions_by_country_and_org")
 
 print("\nTop 15 Organizations:")
 print(org_missions)
@@ -149,38 +230,40 @@ print("\n" + "=" * 70)
 print("ANALYSIS 2: TEMPORAL TRENDS")
 print("=" * 70)
 
-# Missions per year
-missions_per_year = df.groupby("year").size().reset_index(name="missions")
+# Missions and successes per year, computed in a single pass
+stats_year = df.groupby("year")["success"].agg(missions="count", successes="sum")
+missions_per_year = stats_year["missions"].reset_index()
 
-plt.figure(figsize=(16, 6))
-plt.plot(
+# Single-chart figure, reused for every single chart below
+fig, ax = plt.subplots(figsize=(16, 6))
+ax.plot(
     missions_per_year["year"],
     missions_per_year["missions"],
     linewidth=2.5,
 )
-plt.fill_between(
+ax.fill_between(
     missions_per_year["year"],
     missions_per_year["missions"],
     alpha=0.3,
     color="lightblue",
 )
-plt.title("Space Missions Per Year (Historical Trend)", fontsize=16, fontweight="bold")
-plt.xlabel("Year", fontsize=12)
-plt.ylabel("Number of Missions", fontsize=12)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.show()
+ax.set_title(
+    "Space Missions Per Year (Historical Trend)", fontsize=16, fontweight="bold"
+)
+ax.set_xlabel("Year", fontsize=12)
+ax.set_ylabel("Number of Missions", fontsize=12)
+ax.grid(True, alpha=0.3)
+fig.tight_layout()
+show_figure(fig, "missions_per_year")
 
 # Space Race: USA vs Russia vs China
 major_powers = ["United States", "Russia", "China"]
 df_powers = df[df["country_full"].isin(major_powers)]
-power_launches = (
-    df_powers.groupby(["year", "country_full"]).size().unstack(fill_value=0)
-)
+power_launches = pd.crosstab(df_powers["year"], df_powers["country_full"])
 
-plt.figure(figsize=(16, 7))
+reset_figure(fig, (16, 7), ax)
 for country in power_launches.columns:
-    plt.plot(
+    ax.plot(
         power_launches.index,
         power_launches[country],
         linewidth=2.5,
@@ -189,15 +272,15 @@ for country in power_launches.columns:
         markersize=5,
     )
 
-plt.title(
+ax.set_title(
     "Space Race: USA vs Russia vs China Over Time", fontsize=16, fontweight="bold"
 )
-plt.xlabel("Year", fontsize=12)
-plt.ylabel("Number of Launches", fontsize=12)
-plt.legend(fontsize=12, loc="upper left")
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.show()
+ax.set_xlabel("Year", fontsize=12)
+ax.set_ylabel("Number of Launches", fontsize=12)
+ax.legend(fontsize=12, loc="upper left")
+ax.grid(True, alpha=0.3)
+fig.tight_layout()
+show_figure(fig, "space_race_powers")
 
 # Peak years
 top_years = missions_per_year.nlargest(5, "missions")
@@ -227,12 +310,13 @@ month_order = [
     "November",
     "December",
 ]
-month_counts = df["month_name"].value_counts().reindex(month_order)
+month_names = df["date"].dt.month_name().rename("month_name")
+month_counts = month_names.value_counts().reindex(month_order)
 
 print("\nLaunches by Month:")
 print(month_counts)
 
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 6))
+reset_figure(fig_pair, (18, 6), ax1, ax2)
 
 # Bar chart
 month_counts.plot(kind="bar", ax=ax1, color="teal", edgecolor="black")
@@ -247,8 +331,8 @@ month_counts.plot(kind="pie", ax=ax2, autopct="%1.1f%%", colors=colors, startang
 ax2.set_title("Launch Distribution by Month", fontsize=14, fontweight="bold")
 ax2.set_ylabel("")
 
-plt.tight_layout()
-plt.show()
+fig_pair.tight_layout()
+show_figure(fig_pair, "launches_by_month")
 
 # Day of week analysis
 day_order = [
@@ -260,7 +344,8 @@ day_order = [
     "Saturday",
     "Sunday",
 ]
-day_counts = df["day_of_week"].value_counts().reindex(day_order)
+day_names = df["date"].dt.day_name().rename("day_of_week")
+day_counts = day_names.value_counts().reindex(day_order)
 
 print("\nLaunches by Day of Week:")
 print(day_counts)
@@ -275,7 +360,7 @@ print("=" * 70)
 
 # Overall success rate
 total_missions = len(df)
-successful_missions = df["success"].sum()
+successful_missions = int(df["success"].sum())
 success_rate = (successful_missions / total_missions) * 100
 
 print(f"\nOverall Success Rate: {success_rate:.2f}%")
@@ -288,17 +373,32 @@ print("\nMission Status Distribution:")
 print(status_counts)
 
 # Visualize status distribution
-plt.figure(figsize=(12, 6))
-status_counts.head(8).plot(kind="bar", color="green", alpha=0.7, edgecolor="darkgreen")
-plt.title("Mission Outcomes Distribution", fontsize=16, fontweight="bold")
-plt.xlabel("Status", fontsize=12)
-plt.ylabel("Number of Missions", fontsize=12)
-plt.xticks(rotation=45, ha="right")
-plt.tight_layout()
-plt.show()
+reset_figure(fig, (12, 6), ax)
+status_counts.head(8).plot(
+    kind="bar", ax=ax, color="green", alpha=0.7, edgecolor="darkgreen"
+)
+ax.set_title("Mission Outcomes Distribution", fontsize=16, fontweight="bold")
+ax.set_xlabel("Status", fontsize=12)
+ax.set_ylabel("Number of Missions", fontsize=12)
+plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+fig.tight_layout()
+show_figure(fig, "mission_outcomes")
 
 # Success rate by decade
-success_by_decade = df.groupby("decade")["success"].agg(["sum", "count"])
+# Decades form a small dense integer range, so bincount replaces a groupby
+decade_values = df["decade"].to_numpy()
+base_decade = decade_values.min()
+decade_idx = ((decade_values - base_decade) // 10).astype(np.intp)
+decade_counts = np.bincount(decade_idx)
+decade_sums = np.bincount(decade_idx, weights=df["success"].to_numpy(np.float64))
+observed_decades = decade_counts > 0
+success_by_decade = pd.DataFrame(
+    {
+        "sum": decade_sums[observed_decades].astype(np.int64),
+        "count": decade_counts[observed_decades],
+    },
+    index=pd.Index(base_decade + 10 * np.flatnonzero(observed_decades), name="decade"),
+)
 success_by_decade["success_rate"] = (
     success_by_decade["sum"] / success_by_decade["count"]
 ) * 100
@@ -306,48 +406,49 @@ success_by_decade["success_rate"] = (
 print("\nSuccess Rate by Decade:")
 print(success_by_decade)
 
-plt.figure(figsize=(14, 6))
-bars = plt.bar(
+# Color code bars by success rate
+decade_rates = success_by_decade["success_rate"].to_numpy()
+decade_colors = np.where(
+    decade_rates >= 90,
+    "darkgreen",
+    np.where(decade_rates >= 80, "green", "orange"),
+)
+
+reset_figure(fig, (14, 6), ax)
+ax.bar(
     success_by_decade.index,
-    success_by_decade["success_rate"],
-    color="green",
+    decade_rates,
+    color=decade_colors,
     alpha=0.7,
-    edgecolor="darkgreen",
+    edgecolor=decade_colors,
     linewidth=2,
 )
 
-# Color code bars
-for i, bar in enumerate(bars):
-    if success_by_decade["success_rate"].iloc[i] >= 90:
-        bar.set_color("darkgreen")
-    elif success_by_decade["success_rate"].iloc[i] >= 80:
-        bar.set_color("green")
-    else:
-        bar.set_color("orange")
-
-plt.title("Mission Success Rate by Decade", fontsize=16, fontweight="bold")
-plt.xlabel("Decade", fontsize=12)
-plt.ylabel("Success Rate (%)", fontsize=12)
-plt.ylim(0, 100)
-plt.axhline(
+ax.set_title("Mission Success Rate by Decade", fontsize=16, fontweight="bold")
+ax.set_xlabel("Decade", fontsize=12)
+ax.set_ylabel("Success Rate (%)", fontsize=12)
+ax.set_ylim(0, 100)
+ax.axhline(
     y=success_rate,
     color="red",
     linestyle="--",
     linewidth=2,
     label=f"Overall Average: {success_rate:.1f}%",
 )
-plt.legend(fontsize=11)
-plt.grid(True, axis="y", alpha=0.3)
-plt.tight_layout()
-plt.show()
+ax.legend(fontsize=11)
+ax.grid(True, axis="y", alpha=0.3)
+fig.tight_layout()
+show_figure(fig, "success_by_decade")
 
 # Success rate trend over time
-success_by_year = df.groupby("year")["success"].agg(["sum", "count"])
-success_by_year["rate"] = (success_by_year["sum"] / success_by_year["count"]) * 100
+success_by_year = stats_year.copy()
+success_by_year["rate"] = (
+    success_by_year["successes"] / success_by_year["missions"]
+) * 100
 rolling_success = success_by_year["rate"].rolling(window=5, center=True).mean()
 
-plt.figure(figsize=(16, 6))
-plt.plot(
+reset_figure(fig, (16, 6), ax)
+ax.plot(
     success_by_year.index,
     success_by_year["rate"],
     alpha=0.3,
@@ -355,21 +456,21 @@ plt.plot(
     label="Yearly Success Rate",
     color="gray",
 )
-plt.plot(
+ax.plot(
     rolling_success.index,
     rolling_success,
     linewidth=3,
     color="darkgreen",
     label="5-Year Moving Average",
 )
-plt.title("Mission Success Rate Trend Over Time", fontsize=16, fontweight="bold")
-plt.xlabel("Year", fontsize=12)
-plt.ylabel("Success Rate (%)", fontsize=12)
-plt.ylim(0, 105)
-plt.legend(fontsize=12)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.show()
+ax.set_title("Mission Success Rate Trend Over Time", fontsize=16, fontweight="bold")
+ax.set_xlabel("Year", fontsize=12)
+ax.set_ylabel("Success Rate (%)", fontsize=12)
+ax.set_ylim(0, 105)
+ax.legend(fontsize=12)
+ax.grid(True, alpha=0.3)
+fig.tight_layout()
+show_figure(fig, "success_trend")
 
 # ============================================
 # STEP 8: ROCKET FAMILIES AND TYPES
@@ -384,13 +485,13 @@ top_rockets = df["rocket"].value_counts().head(15)
 print("\nTop 15 Most Used Rockets:")
 print(top_rockets)
 
-plt.figure(figsize=(14, 7))
-top_rockets.plot(kind="barh", alpha=0.7)
-plt.title("Top 15 Most Frequently Launched Rockets", fontsize=16, fontweight="bold")
-plt.xlabel("Number of Launches", fontsize=12)
-plt.ylabel("Rocket Configuration", fontsize=12)
-plt.tight_layout()
-plt.show()
+reset_figure(fig, (14, 7), ax)
+top_rockets.plot(kind="barh", ax=ax, alpha=0.7)
+ax.set_title("Top 15 Most Frequently Launched Rockets", fontsize=16, fontweight="bold")
+ax.set_xlabel("Number of Launches", fontsize=12)
+ax.set_ylabel("Rocket Configuration", fontsize=12)
+fig.tight_layout()
+show_figure(fig, "top_rockets")
 
 top_families = df["rocket_family"].value_counts().head(12)
 print("\nTop 12 Rocket Families:")
@@ -409,34 +510,33 @@ country_decade = pd.crosstab(df["country_full"], df["decade"])
 top_countries_heatmap = country_decade.sum(axis=1).nlargest(15).index
 heatmap_data = country_decade.loc[top_countries_heatmap]
 
-plt.figure(figsize=(16, 8))
-sns.heatmap(heatmap_data, cmap="viridis", linewidths=0.5)
-plt.title(
+# Own figure, so the heatmap's colorbar and despined axes don't carry over
+fig_heatmap, ax_heatmap = plt.subplots(figsize=(16, 8))
+sns.heatmap(heatmap_data, ax=ax_heatmap, cmap="viridis", linewidths=0.5)
+ax_heatmap.set_title(
     "Space Missions Heatmap: Top Countries vs Decades", fontsize=16, fontweight="bold"
 )
-plt.xlabel("Decade", fontsize=12)
-plt.ylabel("Country", fontsize=12)
-plt.tight_layout()
-plt.show()
+ax_heatmap.set_xlabel("Decade", fontsize=12)
+ax_heatmap.set_ylabel("Country", fontsize=12)
+fig_heatmap.tight_layout()
+show_figure(fig_heatmap, "country_decade_heatmap")
 
 # Stacked area chart: Top 5 countries over time
-top_5_countries = df["country_full"].value_counts().head(5).index
+top_5_countries = country_missions.index[:5]
 df_top5 = df[df["country_full"].isin(top_5_countries)]
-country_year_stack = (
-    df_top5.groupby(["year", "country_full"]).size().unstack(fill_value=0)
-)
+country_year_stack = pd.crosstab(df_top5["year"], df_top5["country_full"])
 
-plt.figure(figsize=(16, 8))
-country_year_stack.plot.area(stacked=True, alpha=0.8, figsize=(16, 8))
-plt.title(
+reset_figure(fig, (16, 8), ax)
+country_year_stack.plot.area(ax=ax, stacked=True, alpha=0.8)
+ax.set_title(
     "Space Launch Trends: Top 5 Countries (Cumulative)", fontsize=16, fontweight="bold"
 )
-plt.xlabel("Year", fontsize=12)
-plt.ylabel("Number of Launches", fontsize=12)
-plt.legend(title="Country", bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=11)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.show()
+ax.set_xlabel("Year", fontsize=12)
+ax.set_ylabel("Number of Launches", fontsize=12)
+ax.legend(title="Country", bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=11)
+ax.grid(True, alpha=0.3)
+fig.tight_layout()
+show_figure(fig, "top5_countries_area")
 
 # ============================================
 # STEP 10: KEY INSIGHTS SUMMARY
@@ -446,32 +546,27 @@ print("\n" + "=" * 70)
 print("KEY INSIGHTS SUMMARY")
 print("=" * 70)
 
-# Calculate trends
-recent_decade = df[df["decade"] == df["decade"].max()]
-old_decade = df[df["decade"] == df["decade"].min()]
-
-recent_success = recent_decade["success"].mean() * 100 if len(recent_decade) > 0 else 0
-old_success = old_decade["success"].mean() * 100 if len(old_decade) > 0 else 0
+# Calculate trends (first and last decades, already aggregated above)
+recent_success = success_by_decade["success_rate"].iloc[-1]
+old_success = success_by_decade["success_rate"].iloc[0]
 
 # Calculate additional metrics for summary
 top_rocket_name = top_rockets.index[0] if len(top_rockets) > 0 else "N/A"
 top_rocket_count = top_rockets.iloc[0] if len(top_rockets) > 0 else 0
 trend_text = "IMPROVED" if recent_success > old_success else "DECLINED"
-old_decade_label = (
-    f"{old_decade['decade'].iloc[0]}s" if len(old_decade) > 0 else "early years"
-)
-recent_decade_label = (
-    f"{recent_decade['decade'].iloc[0]}s" if len(recent_decade) > 0 else "recent years"
-)
+old_decade_label = f"{success_by_decade.index[0]}s"
+recent_decade_label = f"{success_by_decade.index[-1]}s"
 peak_year = missions_per_year.loc[missions_per_year["missions"].idxmax(), "year"]
 recent_trend = (
     "increasing"
-    if missions_per_year["missions"].iloc[-5:].mean()
+    if missions_per_year["missions"].tail(5).mean()
     > missions_per_year["missions"].iloc[-10:-5].mean()
     else "stable"
 )
 spaceflight_status = (
-    "emerging" if any("SpaceX" in str(x) for x in df["agency"].tail(200)) else "growing"
+    "emerging"
+    if df["agency"].tail(200).str.contains("SpaceX", regex=False, na=False).any()
+    else "growing"
 )
 
 summary = f"""
@@ -530,83 +625,69 @@ print("=" * 70)
 
 try:
     # Create exports directory if it doesn't exist
-    import os
-
     if not os.path.exists("exports"):
         os.makedirs("exports")
         print("\n✅ Created 'exports' directory")
 
-    # 1. Export processed data with all derived columns
+    # Success rates per key, computed in one groupby pass each
+    country_success = (
+        df.groupby("country_full", observed=True)["success"].mean().mul(100)
+    )
+    org_success = df.groupby("agency", observed=True)["success"].mean().mul(100)
+    rocket_success = df.groupby("rocket")["success"].mean().mul(100)
+
+    # 1. Processed data with all derived columns
     processed_file = "exports/processed_mission_data.csv"
-    df.to_csv(processed_file, index=False)
-    print(f"✅ Exported processed data: {processed_file}")
 
-    # 2. Export country statistics
+    # 2. Country statistics
     country_stats = pd.DataFrame(
         {
             "Country": country_missions.index,
             "Total_Missions": country_missions.values,
-            "Success_Rate_%": [
-                (df[df["country_full"] == country]["success"].mean() * 100)
-                for country in country_missions.index
-            ],
+            "Success_Rate_%": country_success.reindex(country_missions.index).values,
         }
     )
     country_file = "exports/country_statistics.csv"
-    country_stats.to_csv(country_file, index=False)
-    print(f"✅ Exported country statistics: {country_file}")
 
-    # 3. Export organization statistics
+    # 3. Organization statistics
     org_stats = pd.DataFrame(
         {
             "Organization": org_missions.index,
             "Total_Missions": org_missions.values,
-            "Success_Rate_%": [
-                (df[df["agency"] == org]["success"].mean() * 100)
-                for org in org_missions.index
-            ],
+            "Success_Rate_%": org_success.reindex(org_missions.index).values,
         }
     )
     org_file = "exports/organization_statistics.csv"
-    org_stats.to_csv(org_file, index=False)
-    print(f"✅ Exported organization statistics: {org_file}")
 
-    # 4. Export yearly trends
+    # 4. Yearly trends
     yearly_stats = missions_per_year.copy()
-    yearly_stats["Success_Rate_%"] = [
-        (df[df["year"] == year]["success"].mean() * 100)
-        for year in yearly_stats["year"]
-    ]
+    yearly_stats["Success_Rate_%"] = (
+        success_by_year["rate"].reindex(yearly_stats["year"]).values
+    )
     yearly_file = "exports/yearly_trends.csv"
-    yearly_stats.to_csv(yearly_file, index=False)
-    print(f"✅ Exported yearly trends: {yearly_file}")
 
-    # 5. Export rocket statistics
+    # 5. Rocket statistics
     rocket_stats = pd.DataFrame(
         {
             "Rocket": top_rockets.index[:20],
             "Total_Launches": top_rockets.values[:20],
-            "Success_Rate_%": [
-                (df[df["rocket"] == rocket]["success"].mean() * 100)
-                for rocket in top_rockets.index[:20]
-            ],
+            "Success_Rate_%": rocket_success.reindex(top_rockets.index[:20]).values,
         }
     )
     rocket_file = "exports/rocket_statistics.csv"
-    rocket_stats.to_csv(rocket_file, index=False)
-    print(f"✅ Exported rocket statistics: {rocket_file}")
 
-    # 6. Export summary report as text file
+    # 6. Summary report as text file
     summary_file = "exports/analysis_summary.txt"
-    with open(summary_file, "w", encoding="utf-8") as f:
-        f.write(summary)
-        f.write(
-            f"\n\nGenerated on: "
-            f"{pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        )
-    print(f"✅ Exported summary report: {summary_file}")
 
-    # 7. Export decade analysis
+    def write_summary(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(summary)
+            f.write(
+                f"\n\nGenerated on: "
+                f"{pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            )
+
+    # 7. Decade analysis
     decade_stats = success_by_decade.copy()
     decade_stats["total_missions"] = decade_stats["count"]
     decade_stats["successful_missions"] = decade_stats["sum"]
@@ -615,14 +696,84 @@ try:
     ]
     decade_stats.columns = ["Total_Missions", "Successful_Missions", "Success_Rate_%"]
     decade_file = "exports/decade_analysis.csv"
-    decade_stats.to_csv(decade_file)
-    print(f"✅ Exported decade analysis: {decade_file}")
 
-    # 8. Export to Excel (all sheets in one file)
+    # (writer, path, writer kwargs, message) for each file, in report order
+    file_exports = [
+        (
+            df.to_csv,
+            processed_file,
+            {"index": False},
+            f"✅ Exported processed data: {processed_file}",
+        ),
+        (
+            country_stats.to_csv,
+            country_file,
+            {"index": False},
+            f"✅ Exported country statistics: {country_file}",
+        ),
+        (
+            org_stats.to_csv,
+            org_file,
+            {"index": False},
+            f"✅ Exported organization statistics: {org_file}",
+        ),
+        (
+            yearly_stats.to_csv,
+            yearly_file,
+            {"index": False},
+            f"✅ Exported yearly trends: {yearly_file}",
+        ),
+        (
+            rocket_stats.to_csv,
+            rocket_file,
+            {"index": False},
+            f"✅ Exported rocket statistics: {rocket_file}",
+        ),
+        (
+            write_summary,
+            summary_file,
+            {},
+            f"✅ Exported summary report: {summary_file}",
+        ),
+        (
+            decade_stats.to_csv,
+            decade_file,
+            {},
+            f"✅ Exported decade analysis: {decade_file}",
+        ),
+    ]
+
+    # pandas' CSV writer holds the GIL, so the pool only overlaps the file I/O;
+    # each file is reported in order once it has been written
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(write, path, **kwargs)
+            for write, path, kwargs, _ in file_exports
+        ]
+        for future, (_, _, _, message) in zip(futures, file_exports):
+            future.result()
+            print(message)
+
+    # 8. Export processed data as Parquet (columnar, keeps dtypes)
+    try:
+        parquet_file = "exports/processed_mission_data.parquet"
+        df.to_parquet(parquet_file, engine="pyarrow", compression="zstd", index=False)
+        print(f"✅ Exported processed data (Parquet): {parquet_file}")
+    except ImportError:
+        print("⚠️  Parquet export skipped (install: pip install pyarrow)")
+
+    # 9. Export to Excel (all sheets in one file)
+    # xlsxwriter writes large sheets considerably faster than openpyxl
     try:
         excel_file = "exports/space_race_complete_analysis.xlsx"
-        with pd.ExcelWriter(excel_file, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="Processed Data", index=False)
+        excel_engine = (
+            "xlsxwriter" if importlib.util.find_spec("xlsxwriter") else "openpyxl"
+        )
+        with pd.ExcelWriter(excel_file, engine=excel_engine) as writer:
+            # Excel cannot store timezones; dates are written as naive UTC
+            df.assign(date=df["date"].dt.tz_localize(None)).to_excel(
+                writer, sheet_name="Processed Data", index=False
+            )
             country_stats.to_excel(writer, sheet_name="Countries", index=False)
             org_stats.to_excel(writer, sheet_name="Organizations", index=False)
             yearly_stats.to_excel(writer, sheet_name="Yearly Trends", index=False)
@@ -630,7 +781,7 @@ try:
             decade_stats.to_excel(writer, sheet_name="Decades")
         print(f"✅ Exported Excel workbook: {excel_file}")
     except ImportError:
-        print("⚠️  Excel export skipped (install: pip install openpyxl)")
+        print("⚠️  Excel export skipped (install: pip install xlsxwriter)")
 
     print("\n" + "=" * 70)
     print("📁 All exports saved to 'exports/' directory")
@@ -639,8 +790,14 @@ try:
 except Exception as e:
     print(f"\n⚠️  Error during export: {e}")
 
+chart_note = (
+    "📈 Charts saved as PNG files in 'exports/'."
+    if args.no_plot
+    else "📈 Check the matplotlib windows for charts."
+)
+
 print(
-    """
+    f"""
     🌟 Thank you for exploring the Space Race data! 🌟
     
          🛸
@@ -651,7 +808,7 @@ print(
         /   \\
        
     📊 All visualizations have been generated.
-    📈 Check the matplotlib windows for charts.
+    {chart_note}
     💾 Analysis results exported to 'exports/' folder.
     🚀 Keep exploring the cosmos!
 """